@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from itertools import cycle, product
-from typing import Any, Callable, List, Mapping, Protocol, Sequence, Tuple
+import functools
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any, Callable, Iterator, List, Mapping, Protocol, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 from Button_Repository import (
-    Clear_Value_List,
     Edit_cmdOK,
     Exit,
     Parameter_Matrix_BHA_Depth_Row0,
@@ -16,7 +17,7 @@ from Button_Repository import (
     Parameter_Matrix_PFD_Row0,
     Parameter_Matrix_Wizard,
     Setup_POOH,
-    Populate_Value_List,
+    Replace_Value_List,
     Sensitivity_Analysis_Calculate,
     Sensitivity_Parameter_ok,
     Sensitivity_Table,
@@ -27,6 +28,8 @@ from Button_Repository import (
 
 
 DEFAULT_MAX_BATCH_SIZE = 200
+# Column order of the (N, 3) combination arrays carried by batches.
+_COMBINATION_FIELDS: Tuple[str, ...] = ("density", "depth", "wob")
 _VALUE_LIST_CACHE: dict[str, Tuple[float, ...]] = {}
 
 _DEFAULT_TEST_INPUTS: Mapping[str, Sequence[float]] = {
@@ -54,35 +57,37 @@ def build_test_dataframe(
     if overrides:
         data.update(overrides)
     normalized = _normalize_test_columns(data)
-    frame = pd.DataFrame(normalized)
-    for column in frame.columns:
-        frame[column] = pd.to_numeric(frame[column], errors="coerce")
-    return frame
+    # Columns arrive as float64 arrays; stacking them yields one consolidated block.
+    return pd.DataFrame(np.column_stack(list(normalized.values())), columns=list(normalized))
 
 
 @dataclass(frozen=True)
 class ParameterGrid:
     """Container for the unique values that define a sensitivity batch."""
 
-    densities: Sequence[float]
-    depths: Sequence[float]
-    wobs: Sequence[float]
+    densities: np.ndarray
+    depths: np.ndarray
+    wobs: np.ndarray
 
     @property
     def sample_count(self) -> int:
         return (
-            len(self.densities)
-            * len(self.depths)
-            * len(self.wobs)
+            self.densities.size
+            * self.depths.size
+            * self.wobs.size
         )
 
 
 @dataclass(frozen=True)
 class PlannedBatch:
-    """Describes a batch configuration before execution."""
+    """Describes a batch configuration before execution.
+
+    ``combinations`` is an (N, 3) float array whose columns follow
+    ``_COMBINATION_FIELDS``.
+    """
 
     parameters: Mapping[str, Sequence[float]]
-    combinations: List[dict[str, float]]
+    combinations: np.ndarray
 
 
 @dataclass
@@ -90,7 +95,7 @@ class BatchResult:
     """Captures the inputs applied to a batch and the resulting table."""
 
     mode: str
-    combinations: List[dict[str, float]]
+    combinations: np.ndarray
     parameters: Mapping[str, List[float]]
     table: pd.DataFrame
 
@@ -102,15 +107,28 @@ class ProgressCallback(Protocol):
 
 @dataclass
 class ProgressReporter:
-    """Lightweight event emitter used by the GUI while automation runs."""
+    """Lightweight event emitter used by the GUI while automation runs.
+
+    Row payloads reuse a single dict, so ``emit`` must not keep a reference to
+    it unless ``retain_payloads`` is set (e.g. when events cross a thread queue).
+    """
 
     emit: ProgressCallback
+    retain_payloads: bool = False
+    _payload: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
 
     def init(self, total_rows: int, **metadata: Any) -> None:
         self.emit("init", {"total_rows": total_rows, **metadata})
 
     def row(self, index: int, payload: dict[str, Any]) -> None:
-        self.emit("row", {"index": index, **payload})
+        if self.retain_payloads:
+            self.emit("row", {"index": index, **payload})
+            return
+        reused = self._payload
+        reused.clear()
+        reused["index"] = index
+        reused.update(payload)
+        self.emit("row", reused)
 
     def done(self, final_inputs: Any, outputs: Any) -> None:
         self.emit("done", {"final_inputs": final_inputs, "outputs": outputs})
@@ -134,7 +152,9 @@ def run_automation(
         Number of parameter combinations permitted per automation iteration.
     """
 
-    # Reset cached value lists when a new automation run begins.
+    # Reset cached value lists when a new automation run begins. The cache is
+    # deliberately not persisted: each run reopens the Sensitivity window and
+    # Exit() closes it, so the matrix state it mirrors does not survive a run.
     _VALUE_LIST_CACHE.clear()
 
     rih_batches = run_rih(inputs, max_batch_size=max_batch_size)
@@ -145,27 +165,8 @@ def run_automation(
 
     results: dict[str, List[BatchResult]] = {"RIH": [], "POOH": []}
 
-    if rih_batches:
-        _prepare_rih_mode()
-        for batch_index, planned in enumerate(rih_batches, start=1):
-            batch_result = _execute_batch(
-                "RIH",
-                planned.parameters,
-                planned.combinations,
-                batch_index,
-            )
-            results["RIH"].append(batch_result)
-
-    if pooh_batches:
-        _prepare_pooh_mode()
-        for batch_index, planned in enumerate(pooh_batches, start=1):
-            batch_result = _execute_batch(
-                "POOH",
-                planned.parameters,
-                planned.combinations,
-                batch_index,
-            )
-            results["POOH"].append(batch_result)
+    _run_mode_batches("RIH", rih_batches, _prepare_rih_mode, results["RIH"])
+    _run_mode_batches("POOH", pooh_batches, _prepare_pooh_mode, results["POOH"])
 
     _execute_batches("RIH", results["RIH"])
     _execute_batches("POOH", results["POOH"])
@@ -177,6 +178,27 @@ def run_automation(
     return results
 
 
+def _run_mode_batches(
+    mode: str,
+    batches: Iterator[PlannedBatch],
+    prepare: Callable[[], None],
+    results: List[BatchResult],
+) -> None:
+    """Execute lazily planned batches for one mode, preparing the mode only if any exist."""
+    first = next(batches, None)
+    if first is None:
+        return
+    prepare()
+    for batch_index, planned in enumerate(chain((first,), batches), start=1):
+        batch_result = _execute_batch(
+            mode,
+            planned.parameters,
+            planned.combinations,
+            batch_index,
+        )
+        results.append(batch_result)
+
+
 def _prepare_rih_mode() -> None:
     """Ensure the application is configured for RIH batches."""
     Set_Parameters_RIH()
@@ -195,94 +217,127 @@ def _plan_chunk_sizes(
         raise ValueError("max_batch_size must be positive")
 
     chunk_sizes: dict[str, int] = {name: 1 for name in lengths}
-    assigned: set[str] = set()
+    # Running product of the chunk sizes assigned so far.
+    product_assigned = 1
 
     for name, length in sorted(lengths.items(), key=lambda item: item[1], reverse=True):
         if length <= 0:
             raise ValueError(f"No values available for parameter '{name}'")
 
-        product_assigned = 1
-        for assigned_name in assigned:
-            product_assigned *= chunk_sizes[assigned_name]
-
-        allowed = max_batch_size // product_assigned if product_assigned else max_batch_size
-        if allowed <= 0:
-            allowed = 1
-
-        chunk_sizes[name] = min(length, allowed)
-        assigned.add(name)
+        allowed = max(1, max_batch_size // product_assigned)
+        chunk = min(length, allowed)
+        chunk_sizes[name] = chunk
+        product_assigned *= chunk
 
     return chunk_sizes
 
 
-def _chunk_sequence(values: Sequence[float], chunk_size: int) -> List[List[float]]:
+def _chunk_sequence(values: Sequence[float], chunk_size: int) -> List[Sequence[float]]:
+    """Split ``values`` into slices of the same type (ndarray views, tuple slices)."""
     if chunk_size <= 0:
         raise ValueError("chunk_size must be positive")
-    if len(values) <= chunk_size:
-        return [list(values)]
-    return [list(values[idx : idx + chunk_size]) for idx in range(0, len(values), chunk_size)]
+    return [values[idx : idx + chunk_size] for idx in range(0, len(values), chunk_size)]
+
+
+@functools.lru_cache(maxsize=64)
+def _cartesian_2d(densities: Tuple[float, ...], depths: Tuple[float, ...]) -> np.ndarray:
+    """Return the (density, depth) prefix shared by RIH and POOH as a read-only (N, 2) array."""
+    n_density, n_depth = len(densities), len(depths)
+    out = np.empty((n_density * n_depth, 2), dtype=np.float64)
+    out[:, 0] = np.repeat(np.asarray(densities, dtype=np.float64), n_depth)
+    out[:, 1] = np.tile(np.asarray(depths, dtype=np.float64), n_density)
+    out.flags.writeable = False
+    return out
+
+
+def _cartesian_soa(
+    densities: Sequence[float],
+    depths: Sequence[float],
+    wobs: Sequence[float],
+) -> np.ndarray:
+    """Return every (density, depth, wob) combination as a read-only (N, 3) float array.
+
+    Rows follow ``itertools.product`` order: density slowest, wob fastest.
+    """
+    prefix = _cartesian_2d(tuple(densities), tuple(depths))
+    wob_values = np.asarray(wobs, dtype=np.float64)
+    out = np.empty((len(prefix) * wob_values.size, 3), dtype=np.float64)
+    out[:, :2] = np.repeat(prefix, wob_values.size, axis=0)
+    out[:, 2] = np.tile(wob_values, len(prefix))
+    out.flags.writeable = False
+    return out
 
 
 def _generate_batches_from_grid(
     grid: ParameterGrid,
     max_batch_size: int,
-) -> List[PlannedBatch]:
-    if grid.sample_count == 0:
-        return []
+) -> Iterator[PlannedBatch]:
+    """Yield planned batches lazily; the chunk plan is validated and memoized up front."""
+    plan = _plan_batches(
+        tuple(grid.densities.tolist()),
+        tuple(grid.depths.tolist()),
+        tuple(grid.wobs.tolist()),
+        max_batch_size,
+    )
+    return (
+        PlannedBatch(
+            parameters={"density": density_values, "depth": depth_values, "wob": wob_values},
+            combinations=_cartesian_soa(density_values, depth_values, wob_values),
+        )
+        for density_values, depth_values, wob_values in plan
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _plan_batches(
+    densities: Tuple[float, ...],
+    depths: Tuple[float, ...],
+    wobs: Tuple[float, ...],
+    max_batch_size: int,
+) -> Tuple[Tuple[Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]], ...]:
+    """Memoized chunk plan: one (densities, depths, wobs) value triple per batch."""
+    if not densities or not depths or not wobs:
+        return ()
 
     lengths = {
-        "density": len(grid.densities),
-        "depth": len(grid.depths),
-        "wob": len(grid.wobs),
+        "density": len(densities),
+        "depth": len(depths),
+        "wob": len(wobs),
     }
     chunk_sizes = _plan_chunk_sizes(lengths, max_batch_size)
 
-    density_chunks = _chunk_sequence(list(grid.densities), chunk_sizes["density"])
-    depth_chunks = _chunk_sequence(list(grid.depths), chunk_sizes["depth"])
-    wob_chunks = _chunk_sequence(list(grid.wobs), chunk_sizes["wob"])
-
-    batches: List[PlannedBatch] = []
-    for density_values in density_chunks:
-        for depth_values in depth_chunks:
-            for wob_values in wob_chunks:
-                if not density_values or not depth_values or not wob_values:
-                    continue
-                combinations = [
-                    {"density": density, "depth": depth, "wob": wob}
-                    for density, depth, wob in product(density_values, depth_values, wob_values)
-                ]
-                if not combinations:
-                    continue
-                parameters = {
-                    "density": tuple(density_values),
-                    "depth": tuple(depth_values),
-                    "wob": tuple(wob_values),
-                }
-                batches.append(PlannedBatch(parameters=parameters, combinations=combinations))
-
-    return batches
+    # Each chunk is converted to a tuple once here, not once per (density, depth, wob) triple.
+    density_chunks = [tuple(chunk) for chunk in _chunk_sequence(densities, chunk_sizes["density"])]
+    depth_chunks = [tuple(chunk) for chunk in _chunk_sequence(depths, chunk_sizes["depth"])]
+    wob_chunks = [tuple(chunk) for chunk in _chunk_sequence(wobs, chunk_sizes["wob"])]
+
+    return tuple(
+        (density_values, depth_values, wob_values)
+        for density_values in density_chunks
+        for depth_values in depth_chunks
+        for wob_values in wob_chunks
+    )
 
 
 def _execute_batch(
     mode: str,
     parameters: Mapping[str, Sequence[float]],
-    combinations: Sequence[dict[str, float]],
+    combinations: np.ndarray,
     batch_index: int,
 ) -> BatchResult:
-    if not combinations:
+    if not len(combinations):
         raise ValueError(f"Batch {batch_index} for {mode} is empty.")
 
     _update_parameter_matrix(mode, parameters)
 
     Sensitivity_Analysis_Calculate()
-    table = Sensitivity_Table().copy()
-    table["mode"] = mode
-    table["batch_index"] = batch_index
+    # Sensitivity_Table builds a fresh frame on every call, so no defensive copy.
+    table = Sensitivity_Table().assign(mode=mode, batch_index=batch_index)
 
     return BatchResult(
         mode=mode,
-        combinations=list(combinations),
-        parameters={key: list(value) for key, value in parameters.items()},
+        combinations=combinations,
+        parameters={key: [_plain_number(v) for v in value] for key, value in parameters.items()},
         table=table,
     )
 
@@ -318,22 +373,27 @@ def _apply_value_list(
         return
 
     selector()
-    Clear_Value_List()
-    Populate_Value_List([_format_value(value) for value in values])
+    Replace_Value_List(list(map(_format_value, normalized)))
     Edit_cmdOK()
     _VALUE_LIST_CACHE[cache_key] = normalized
 
 
 def _format_value(value: float) -> str:
-    if pd.isna(value):
+    if value != value:  # NaN is the only float unequal to itself
         raise ValueError("Parameter matrix values must not be NaN.")
-    return f"{value:.6g}"
+    return format(value, ".6g")
+
+def _plain_number(value: float) -> int | float:
+    """Return whole numbers as int so all-integer inputs display as ``100``, not ``100.0``."""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
 
 def run_rih(
     inputs: pd.DataFrame,
     *,
     max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
-) -> List[PlannedBatch]:
+) -> Iterator[PlannedBatch]:
     """Prepare batched parameter combinations for running RIH automation."""
     grid = _build_parameter_grid(
         inputs,
@@ -348,7 +408,7 @@ def run_pooh(
     inputs: pd.DataFrame,
     *,
     max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
-) -> List[PlannedBatch]:
+) -> Iterator[PlannedBatch]:
     """Prepare batched parameter combinations for running POOH automation."""
     grid = _build_parameter_grid(
         inputs,
@@ -390,40 +450,45 @@ def _log_batch_details(mode: str, batch_index: int, batch: BatchResult) -> None:
     print(f"[automation] {mode} batch {batch_index}: {len(batch.combinations)} samples ready")
 
 
-def _unique_non_null(series: pd.Series) -> List[float]:
-    values = series.dropna().unique().tolist()
-    if not values:
+def _unique_non_null(series: pd.Series) -> np.ndarray:
+    """Return the distinct non-NaN values of ``series`` in ascending order.
+
+    np.unique sorts as it deduplicates. The ordering is intentional: neighbouring
+    values land in the same chunk, and the value lists entered into Cerberus
+    step monotonically from batch to batch.
+    """
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = np.unique(values[~np.isnan(values)])
+    if not values.size:
         raise ValueError(f"No valid values found for column '{series.name}'")
     return values
 
 
 def _ensure_columns(df: pd.DataFrame, *columns: str) -> None:
-    missing = [column for column in columns if column not in df.columns]
+    available = frozenset(df.columns)
+    missing = [column for column in columns if column not in available]
     if missing:
         joined = ", ".join(missing)
         raise KeyError(f"Missing required input column(s): {joined}")
 
 
-def _normalize_test_columns(data: Mapping[str, Sequence[float]]) -> dict[str, List[float]]:
-    lengths = [len(values) for values in data.values() if values]
+def _normalize_test_columns(data: Mapping[str, Sequence[float]]) -> dict[str, np.ndarray]:
+    lengths = [len(values) for values in data.values() if len(values)]
     if not lengths:
         raise ValueError("Provide at least one value for the test DataFrame.")
 
     max_length = max(lengths)
 
-    normalized: dict[str, List[float]] = {}
+    normalized: dict[str, np.ndarray] = {}
     for column, values in data.items():
-        if not values:
-            normalized[column] = [pd.NA] * max_length
+        if not len(values):
+            normalized[column] = np.full(max_length, np.nan)
             continue
 
-        if len(values) == max_length:
-            normalized[column] = list(values)
-        elif len(values) == 1:
-            normalized[column] = [values[0]] * max_length
-        else:
-            iterator = cycle(values)
-            normalized[column] = [next(iterator) for _ in range(max_length)]
+        # Missing and non-numeric entries become NaN, as the old per-column coercion did.
+        numeric = pd.to_numeric(pd.Series(list(values), dtype=object), errors="coerce")
+        # np.resize repeats shorter (including single-value) sequences cyclically.
+        normalized[column] = np.resize(numeric.to_numpy(dtype=np.float64, na_value=np.nan), max_length)
 
     return normalized
 
@@ -501,9 +566,10 @@ def _count_samples(outputs: Mapping[str, List[BatchResult]]) -> int:
 
 
 def _iterate_combos(outputs: Mapping[str, List[BatchResult]]):
+    """Yield ``(mode, (density, depth, wob))`` for every executed combination."""
     for mode, batches in outputs.items():
         for batch in batches:
-            for combo in batch.combinations:
+            for combo in batch.combinations.tolist():
                 yield mode, combo
 
 
@@ -540,12 +606,7 @@ class CerberusEngine:
                 continue
             progress.row(
                 index,
-                {
-                    "mode": mode,
-                    "density": combo.get("density"),
-                    "depth": combo.get("depth"),
-                    "wob": combo.get("wob"),
-                },
+                {"mode": mode, **{field: _plain_number(v) for field, v in zip(_COMBINATION_FIELDS, combo)}},
             )
 
         progress.done(final_inputs=data_list, outputs=outputs)
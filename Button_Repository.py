@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
+from _ctypes import COMError
 from ctypes import windll, wintypes
+from itertools import zip_longest
 from pathlib import Path
 import time
 from typing import Any, Mapping, Sequence
@@ -10,7 +12,9 @@ import warnings
 # Clear comtypes cache if there's a version mismatch
 try:
     import comtypes.client
-    from comtypes.gen.UIAutomationClient import IUIAutomation, TreeScope_Descendants
+    from comtypes.gen.UIAutomationClient import (
+        IUIAutomation, TreeScope_Children, TreeScope_Descendants, TreeScope_Element,
+    )
 except ImportError:
     # Cache is stale - clear and regenerate
     import comtypes.client
@@ -21,20 +25,16 @@ except ImportError:
                 item.unlink()
     # Regenerate
     comtypes.client.GetModule('UIAutomationCore.dll')
-    from comtypes.gen.UIAutomationClient import IUIAutomation, TreeScope_Descendants
+    from comtypes.gen.UIAutomationClient import (
+        IUIAutomation, TreeScope_Children, TreeScope_Descendants, TreeScope_Element,
+    )
 
+import numpy as np
 import pandas as pd
 from pywinauto import Application, timings
 from pywinauto.controls.uiawrapper import UIAWrapper
 from pywinauto.uia_element_info import UIAElementInfo
 
-warnings.filterwarnings(
-    "ignore",
-    message="32-bit application should be automated using 32-bit Python",
-    category=UserWarning,
-    module="pywinauto.application",
-)
-
 timings.Timings.window_find_timeout = 1.0
 timings.Timings.window_find_retry = 0.05
 timings.Timings.after_click_wait = 0.0
@@ -48,11 +48,102 @@ _FIND_WINDOW_EX.argtypes = [
 ]
 _FIND_WINDOW_EX.restype = wintypes.HWND
 
+_IS_WINDOW = windll.user32.IsWindow
+_IS_WINDOW.argtypes = [wintypes.HWND]
+_IS_WINDOW.restype = wintypes.BOOL
+
+# Shared IUIAutomation instance, created once at import so element searches
+# do not pay COM activation on every call.
+_IUIA = comtypes.client.CreateObject('{ff48dba4-60ef-4201-aa87-54103eef594e}', interface=IUIAutomation)
+
+# Property conditions keyed by (property id, value); they are immutable COM
+# objects, so one instance per lookup key can be reused for every search.
+_CONDITION_CACHE: dict[tuple[int, Any], Any] = {}
+# OR conditions over several automation ids, keyed by the id tuple
+_ANY_ID_CONDITION_CACHE: dict[tuple[str, ...], Any] = {}
+
+_UIA_CONTROL_TYPE_PROPERTY_ID = 30003
+_UIA_LIST_ITEM_CONTROL_TYPE_ID = 50007
+_UIA_NAME_PROPERTY_ID = 30005
+_UIA_IS_VALUE_PATTERN_AVAILABLE_PROPERTY_ID = 30043
+_UIA_VALUE_VALUE_PROPERTY_ID = 30045
+_UIA_LEGACY_VALUE_PROPERTY_ID = 30093
+_UIA_AUTOMATION_ID_PROPERTY_ID = 30011
+_UIA_TOGGLE_STATE_PROPERTY_ID = 30086
+_UIA_SELECTION_CAN_SELECT_MULTIPLE_PROPERTY_ID = 30060
+
+# Cache request for reading a whole grid in one round trip: each row is
+# fetched together with its cells, and every cell carries the properties
+# needed to resolve its text. Mode None skips live element references.
+_GRID_CACHE_REQUEST = _IUIA.CreateCacheRequest()
+for _property_id in (
+    _UIA_NAME_PROPERTY_ID,
+    _UIA_IS_VALUE_PATTERN_AVAILABLE_PROPERTY_ID,
+    _UIA_VALUE_VALUE_PROPERTY_ID,
+    _UIA_LEGACY_VALUE_PROPERTY_ID,
+):
+    _GRID_CACHE_REQUEST.AddProperty(_property_id)
+_GRID_CACHE_REQUEST.TreeScope = TreeScope_Element | TreeScope_Children
+# Raw view, matching the rows/cells pywinauto's children() used to return
+_GRID_CACHE_REQUEST.TreeFilter = _IUIA.CreateTrueCondition()
+_GRID_CACHE_REQUEST.AutomationElementMode = 0  # AutomationElementMode_None
+del _property_id
+
+# Checkbox lookups fetch the automation id and toggle state with the search
+# itself, so comparing states needs no further cross-process calls.
+_TOGGLE_CACHE_REQUEST = _IUIA.CreateCacheRequest()
+_TOGGLE_CACHE_REQUEST.AddProperty(_UIA_AUTOMATION_ID_PROPERTY_ID)
+_TOGGLE_CACHE_REQUEST.AddProperty(_UIA_TOGGLE_STATE_PROPERTY_ID)
+
+# Unambiguous alternation (integer part with optional fraction, or bare
+# fraction) so the engine never re-splits a digit run between \d* and \d+.
+_NUMERIC_EXTRACT_RE = re.compile(r"([-+]?(?:\d+(?:\.\d+)?|\.\d+))")
+_WS_RE = re.compile(r"\s+")
+
+# Substrings that identify the Sensitivity grid header row
+_HEADER_MARKERS: tuple[str, ...] = (
+    "BHA Depth",
+    "Pipe Fluid Density",
+    "Force on End",
+    "\r(",
+)
+# All markers in one alternation, searched once over a row's joined cells.
+# Cells are joined with a unit separator that no marker contains, so a match
+# can never straddle two cells.
+_HEADER_MARKER_RE = re.compile("|".join(map(re.escape, _HEADER_MARKERS)))
+_CELL_SEPARATOR = "\x1f"
+
+# Parameter Matrix header row snapshot and column indices keyed by header
+# name; the grid layout is fixed for the lifetime of an application connection.
+_MATRIX_HEADERS: list[str] = []
+_MATRIX_COLUMN_CACHE: dict[str, int] = {}
+
 
 # ---------------------------------------------------------------------------
 # Cached Application Connection
 # ---------------------------------------------------------------------------
 
+def _connect_app() -> Application:
+    """Connect to the Orpheus main window, muting pywinauto's bitness warning."""
+    # Scoped to the connect call instead of a process-wide filter
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore",
+            message="32-bit application should be automated using 32-bit Python",
+            category=UserWarning,
+        )
+        return Application(backend="uia").connect(auto_id="frmOrpheus")
+
+
+def _element_alive(element) -> bool:
+    """Cheap liveness check: the element still resolves to an existing window."""
+    try:
+        handle = element.CurrentNativeWindowHandle
+    except COMError:
+        return False
+    return bool(handle) and bool(_IS_WINDOW(handle))
+
+
 class _AppConnection:
     """Singleton class to cache the application connection and root element."""
     _instance = None
@@ -68,14 +159,31 @@ class _AppConnection:
             return
         
         # Connect once and reuse the app connection
-        self.app = Application(backend="uia").connect(auto_id="frmOrpheus")
+        self.app = _connect_app()
         # Get root element for fast searches
         self.root = self.app.top_window().element_info.element
+        # Window anchors (e.g. frmOrphSensitivity) keyed by automation id
+        self._anchors: dict[str, Any] = {}
+        # Wrapped Parameter Matrix grid (grdVal), resolved on first use
+        self.matrix_grid = None
         self._initialized = True
     
     def get_root(self):
-        """Get the cached root element."""
+        """Get the cached root element, re-resolving it if its window is gone."""
+        if not _element_alive(self.root):
+            self.refresh()
         return self.root
+
+    def get_anchor(self, automation_id: str):
+        """Get a cached window element under the root, re-finding it once it closes."""
+        anchor = self._anchors.get(automation_id)
+        if anchor is None or not _element_alive(anchor):
+            anchor = find_element_near_raw(self.get_root(), automation_id)
+            if anchor is None:
+                self._anchors.pop(automation_id, None)
+                return None
+            self._anchors[automation_id] = anchor
+        return anchor
     
     def get_app(self):
         """Get the cached application."""
@@ -85,16 +193,21 @@ class _AppConnection:
         """Refresh the connection if needed."""
         try:
             # Test if connection is still valid
-            _ = self.app.top_window()
+            top_window = self.app.top_window()
         except Exception:
             # Reconnect
-            self.app = Application(backend="uia").connect(auto_id="frmOrpheus")
-            self.root = self.app.top_window().element_info.element
+            self.app = _connect_app()
+            top_window = self.app.top_window()
+        self.root = top_window.element_info.element
+        self._anchors.clear()
+        self.matrix_grid = None
     
     @classmethod
     def reset(cls):
         """Reset the singleton instance to force fresh connection on next use."""
         cls._instance = None
+        _MATRIX_HEADERS.clear()
+        _MATRIX_COLUMN_CACHE.clear()
 
 
 def _get_app_root():
@@ -107,38 +220,117 @@ def _get_app():
     return _AppConnection().get_app()
 
 
+def _get_sensitivity_root():
+    """Get the cached Sensitivity Analysis window element (frmOrphSensitivity)."""
+    return _AppConnection().get_anchor("frmOrphSensitivity")
+
+
+def _get_matrix_root():
+    """Get the cached Parameter Matrix window element (frmSensitivityMatrix)."""
+    return _AppConnection().get_anchor("frmSensitivityMatrix")
+
+
 # ---------------------------------------------------------------------------
 # Fast element search helpers
 # ---------------------------------------------------------------------------
 
+def _property_condition(property_id: int, value: Any):
+    """Return a cached UIA property condition for ``property_id == value``."""
+    key = (property_id, value)
+    condition = _CONDITION_CACHE.get(key)
+    if condition is None:
+        condition = _CONDITION_CACHE[key] = _IUIA.CreatePropertyCondition(property_id, value)
+    return condition
+
+
+def _wrap(element):
+    """Wrap a raw IUIAutomationElement for pywinauto actions (None stays None)."""
+    return UIAWrapper(UIAElementInfo(element)) if element else None
+
+
+def find_element_fast_raw(root_element, automation_id):
+    """Descendant search returning the raw IUIAutomationElement (or None)."""
+    element = root_element.FindFirst(TreeScope_Descendants, _property_condition(30011, automation_id))
+    return element if element else None
+
+
 def find_element_fast(root_element, automation_id, found_index=0):
     """
     Fast element search using direct UIA API
     10x faster than pywinauto's window() search
     """
-    uia = comtypes.client.GetModule('UIAutomationCore.dll')
-    iuia = comtypes.client.CreateObject('{ff48dba4-60ef-4201-aa87-54103eef594e}', interface=IUIAutomation)
-    
-    condition = iuia.CreatePropertyCondition(30011, automation_id)  # AutomationId
-    
     if found_index == 0:
         # Just find first
-        element = root_element.FindFirst(TreeScope_Descendants, condition)
-        return UIAWrapper(UIAElementInfo(element)) if element else None
+        return _wrap(find_element_fast_raw(root_element, automation_id))
     else:
         # Find all and return specific index
+        condition = _property_condition(30011, automation_id)  # AutomationId
         elements_array = root_element.FindAll(TreeScope_Descendants, condition)
         if found_index < elements_array.Length:
             element = elements_array.GetElement(found_index)
-            return UIAWrapper(UIAElementInfo(element))
+            return _wrap(element)
         return None
 
+def find_child_fast_raw(parent_element, automation_id, property_id=30011):
+    """
+    Scan only the direct children of parent_element with the raw view walker.
+    Avoids a full descendant traversal when the target is one level down.
+    """
+    walker = _IUIA.RawViewWalker
+    child = walker.GetFirstChildElement(parent_element)
+    while child:
+        if child.GetCurrentPropertyValue(property_id) == automation_id:
+            return child
+        child = walker.GetNextSiblingElement(child)
+    return None
+
+
+def find_child_fast(parent_element, automation_id, property_id=30011):
+    """Wrapped variant of find_child_fast_raw."""
+    return _wrap(find_child_fast_raw(parent_element, automation_id, property_id))
+
+
+def find_element_near_raw(parent_element, automation_id):
+    """Try the direct children first, then fall back to a descendant search."""
+    element = find_child_fast_raw(parent_element, automation_id)
+    if element is None:
+        element = find_element_fast_raw(parent_element, automation_id)
+    return element
+
+
+def find_element_near(parent_element, automation_id):
+    """Wrapped variant of find_element_near_raw."""
+    return _wrap(find_element_near_raw(parent_element, automation_id))
+
+def find_elements_by_ids(root_element, automation_ids: Sequence[str], cache_request=None) -> dict[str, Any]:
+    """Resolve several automation ids with one descendant FindAll.
+
+    Returns raw elements keyed by automation id; ids that were not found are
+    simply absent from the result. A ``cache_request`` that includes the
+    AutomationId property fetches its properties along with the search.
+    """
+    ids = tuple(automation_ids)
+    condition = _ANY_ID_CONDITION_CACHE.get(ids)
+    if condition is None:
+        condition = _ANY_ID_CONDITION_CACHE[ids] = _IUIA.CreateOrConditionFromArray(
+            [_property_condition(30011, aid) for aid in ids]
+        )
+    found: dict[str, Any] = {}
+    if cache_request is None:
+        elements = root_element.FindAll(TreeScope_Descendants, condition)
+        for i in range(elements.Length):
+            element = elements.GetElement(i)
+            found.setdefault(element.CurrentAutomationId, element)
+    else:
+        elements = root_element.FindAllBuildCache(TreeScope_Descendants, condition, cache_request)
+        for i in range(elements.Length):
+            element = elements.GetElement(i)
+            found.setdefault(element.CachedAutomationId, element)
+    return found
+
 def find_element_by_title(root_element, title):
     """Fast search by title/name"""
-    uia = comtypes.client.GetModule('UIAutomationCore.dll')
-    iuia = comtypes.client.CreateObject('{ff48dba4-60ef-4201-aa87-54103eef594e}', interface=IUIAutomation)
-    
-    condition = iuia.CreatePropertyCondition(30005, title)  # Name property
+    condition = _property_condition(30005, title)  # Name property
     element = root_element.FindFirst(TreeScope_Descendants, condition)
     return UIAWrapper(UIAElementInfo(element)) if element else None
 
@@ -148,14 +340,96 @@ def find_element_by_title(root_element, title):
 
 def _coerce_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Attempt to coerce string columns into numeric dtype where possible."""
-    numeric_pattern = r"([-+]?\d*\.?\d+)"
-    for column in df.columns:
-        extracted = df[column].astype(str).str.extract(numeric_pattern)[0]
-        if extracted.notna().any():
-            numeric = pd.to_numeric(extracted, errors="coerce")
-            if numeric.notna().any():
-                df[column] = numeric
-    return df
+    # Columns that already arrive numeric need no string pass
+    candidates = [
+        idx for idx in range(df.shape[1])
+        if not pd.api.types.is_numeric_dtype(df.iloc[:, idx])
+    ]
+    if df.empty or not candidates:
+        return df
+
+    # Converted columns by position; written back in one pass at the end.
+    # Each column keeps the dtype pd.to_numeric gives it, so all-integer
+    # columns stay int64 and display without a trailing ".0".
+    converted: dict[int, np.ndarray] = {}
+
+    # All candidate cells in one column-major "string" Series; the dtype skips
+    # numpy's fixed-width unicode copy and uses Arrow-backed string kernels
+    # whenever pandas has pyarrow available.
+    block = df.iloc[:, candidates].to_numpy(dtype=object)
+    cells = pd.Series(block.ravel(order="F"), dtype="string")
+
+    # Fast path: a cell the pattern matches in full is its own extraction, so
+    # only the rest go through str.extract. Gating on the regex (rather than
+    # on what pd.to_numeric accepts) keeps "1e5", "inf" and "3." parsing
+    # exactly as the extract does.
+    full = cells.str.fullmatch(_NUMERIC_EXTRACT_RE).fillna(False).to_numpy(dtype=bool)
+    texts = np.where(full, cells.to_numpy(dtype=object, na_value=np.nan), np.nan)
+    pending = ~full & cells.notna().to_numpy()
+    if pending.any():
+        extracted = cells[pending].str.extract(_NUMERIC_EXTRACT_RE, expand=False)
+        texts[pending] = extracted.to_numpy(dtype=object, na_value=np.nan)
+    texts = texts.reshape(block.shape, order="F")
+
+    # Every regex match parses, so any text at all means the column converts.
+    for pos in np.flatnonzero(pd.notna(texts).any(axis=0)):
+        numeric = pd.to_numeric(pd.Series(texts[:, pos], dtype=object), errors="coerce")
+        converted[candidates[pos]] = numeric.to_numpy()
+    return _replace_columns(df, converted)
+
+
+def _replace_columns(df: pd.DataFrame, converted: Mapping[int, np.ndarray]) -> pd.DataFrame:
+    """Swap in converted columns by position, rebuilding the frame once."""
+    if not converted:
+        return df
+    data = {
+        idx: converted[idx] if idx in converted else df.iloc[:, idx]
+        for idx in range(df.shape[1])
+    }
+    result = pd.DataFrame(data, index=df.index)
+    result.columns = df.columns
+    return result
+
+
+def _cached_cell_text(cell) -> str:
+    """Resolve a cell's text from cached properties, mirroring the live lookup order."""
+    if cell.GetCachedPropertyValue(_UIA_IS_VALUE_PATTERN_AVAILABLE_PROPERTY_ID):
+        value = cell.GetCachedPropertyValue(_UIA_VALUE_VALUE_PROPERTY_ID)
+    else:
+        value = cell.GetCachedPropertyValue(_UIA_LEGACY_VALUE_PROPERTY_ID)
+    # Unsupported patterns yield UIA's not-supported sentinel (a COM object), not None
+    if not isinstance(value, (str, int, float)):
+        value = cell.GetCachedPropertyValue(_UIA_NAME_PROPERTY_ID)
+    return str(value) if isinstance(value, (str, int, float)) else ""
+
+
+def _read_grid_rows(grid_element) -> list[list[str]]:
+    """Read every row's cell texts with a single cached FindAll."""
+    rows = grid_element.FindAllBuildCache(
+        TreeScope_Children, _IUIA.CreateTrueCondition(), _GRID_CACHE_REQUEST
+    )
+    if not rows:
+        return []
+    grid_rows = []
+    for i in range(rows.Length):
+        cells = rows.GetElement(i).GetCachedChildren()
+        if not cells:
+            grid_rows.append([])
+            continue
+        grid_rows.append([_cached_cell_text(cells.GetElement(j)) for j in range(cells.Length)])
+    return grid_rows
+
+
+def _non_empty_columns(columns: Sequence[Sequence[object]]) -> list[bool]:
+    """Flag raw grid columns holding at least one non-blank cell."""
+    # Short-circuits on the first populated cell of each column
+    return [
+        any(
+            value is not None and (not isinstance(value, str) or value.strip() != "")
+            for value in column
+        )
+        for column in columns
+    ]
 
 
 def _ensure_parameters_tab(timeout: float = 90.0) -> None:
@@ -176,7 +450,7 @@ def _is_generic_header(name: object) -> bool:
 
 def _normalize_uia_name(value: str | None) -> str:
     """Collapse whitespace/newlines and lowercase for reliable matching."""
-    return " ".join(str(value or "").split()).lower()
+    return _WS_RE.sub(" ", str(value or "")).strip().lower()
 
 
 # ---------------------------------------------------------------------------
@@ -186,8 +460,11 @@ def _normalize_uia_name(value: str | None) -> str:
 def _get_checkbox_and_toggle(automation_id: str, checked: bool | None):
     """Helper to get checkbox and toggle its state if needed."""
     root = _get_app_root()
-    checkbox = find_element_fast(root, automation_id)
-    
+    _toggle_checkbox(find_element_fast(root, automation_id), checked)
+
+
+def _toggle_checkbox(checkbox, checked: bool | None) -> None:
+    """Toggle ``checkbox``, or only bring it to ``checked`` when a state is given."""
     if checked is None:
         # Read mode - just click to toggle
         #checkbox.set_focus()
@@ -210,7 +487,7 @@ def _get_checkbox_and_toggle(automation_id: str, checked: bool | None):
 def button_Sensitivity_Analysis():
     """Navigate to Tools > Sensitivity Analysis... (button1)."""
     root = _get_app_root()
-    MenuStrip1 = find_element_fast(root, "MenuStrip1").element_info.element
+    MenuStrip1 = find_element_near_raw(root, "MenuStrip1")
     tools_menu = find_element_by_title(MenuStrip1, "Tools")
     tools_menu.set_focus()
     tools_menu.click_input()
@@ -259,87 +536,123 @@ def Sensitivity_Setting_Outputs(timeout: float = 90.0):
             pass
 
 
-def Parameters_Pipe_fluid_density(checked: bool | None = None, timeout: float = 90.0):
-    """Toggle or read Pipe Fluid Density (button5)."""
-    #_ensure_parameters_tab(timeout=timeout)
-    _get_checkbox_and_toggle("chkPipeFluidDens", checked)
-
-
-
-def Parameters_Depth(checked: bool | None = None, timeout: float = 90.0):
-    """Toggle or read BHA Depth (button32)."""
-    #_ensure_parameters_tab(timeout=timeout)
-    _get_checkbox_and_toggle("chkDepth", checked)
-
-
-def Parameters_FF(checked: bool | None = None, timeout: float = 90.0):
-    """Toggle or read Friction Factor (button33)."""
-    #_ensure_parameters_tab(timeout=timeout)
-    _get_checkbox_and_toggle("chkFriction", checked)
+def _checkbox_toggle(name: str, automation_id: str, doc: str):
+    """Build a ``Parameters_*`` wrapper that toggles or sets one checkbox."""
+    def toggle(checked: bool | None = None, timeout: float = 90.0):
+        _get_checkbox_and_toggle(automation_id, checked)
 
+    toggle.__name__ = toggle.__qualname__ = name
+    toggle.__doc__ = doc
+    return toggle
 
-def Parameters_POOH(checked: bool | None = None, timeout: float = 90.0):
-    """Toggle or read the POOH parameter checkbox (button6)."""
-    #_ensure_parameters_tab(timeout=timeout)
-    _get_checkbox_and_toggle("chkFOE_POOH", checked)
-
-
-def Parameters_RIH(checked: bool | None = None, timeout: float = 90.0):
-    """Toggle or read the RIH parameter checkbox (button26)."""
-    #_ensure_parameters_tab(timeout=timeout)
-    _get_checkbox_and_toggle("chkFOE", checked)
-
-
-def Parameters_Maximum_Surface_Weight_During_POOH(
-    checked: bool | None = None, timeout: float = 90.0
-):
-    """Toggle or read Max surface weight during POOH (button8)."""
-    #_ensure_outputs_tab(timeout=timeout)
-    _get_checkbox_and_toggle("chkPOOH_MaxSW", checked)
 
+# Parameters tab
+Parameters_Pipe_fluid_density = _checkbox_toggle(
+    "Parameters_Pipe_fluid_density", "chkPipeFluidDens",
+    "Toggle or read Pipe Fluid Density (button5).",
+)
+Parameters_Depth = _checkbox_toggle(
+    "Parameters_Depth", "chkDepth",
+    "Toggle or read BHA Depth (button32).",
+)
+Parameters_FF = _checkbox_toggle(
+    "Parameters_FF", "chkFriction",
+    "Toggle or read Friction Factor (button33).",
+)
+Parameters_POOH = _checkbox_toggle(
+    "Parameters_POOH", "chkFOE_POOH",
+    "Toggle or read the POOH parameter checkbox (button6).",
+)
+Parameters_RIH = _checkbox_toggle(
+    "Parameters_RIH", "chkFOE",
+    "Toggle or read the RIH parameter checkbox (button26).",
+)
 
-def Parameters_Maximum_pipe_stress_during_POOH_percent_of_YS(
-    checked: bool | None = None, timeout: float = 90.0
-):
-    """Toggle or read Max pipe stress during POOH (% of YS) (button9)."""
-    #_ensure_outputs_tab(timeout=timeout)
-    _get_checkbox_and_toggle("chkPOOH_MaxYield", checked)
+# Outputs tab
+Parameters_Maximum_Surface_Weight_During_POOH = _checkbox_toggle(
+    "Parameters_Maximum_Surface_Weight_During_POOH", "chkPOOH_MaxSW",
+    "Toggle or read Max surface weight during POOH (button8).",
+)
+Parameters_Maximum_pipe_stress_during_POOH_percent_of_YS = _checkbox_toggle(
+    "Parameters_Maximum_pipe_stress_during_POOH_percent_of_YS", "chkPOOH_MaxYield",
+    "Toggle or read Max pipe stress during POOH (% of YS) (button9).",
+)
+Parameters_Minimum_Surface_Weight_During_RIH = _checkbox_toggle(
+    "Parameters_Minimum_Surface_Weight_During_RIH", "chkRIH_MinSW",
+    "Toggle or read Min surface weight during RIH (button23).",
+)
 
 
-def Parameters_Minimum_Surface_Weight_During_RIH(
-    checked: bool | None = None, timeout: float = 90.0
-):
-    """Toggle or read Min surface weight during RIH (button23)."""
-    #_ensure_outputs_tab(timeout=timeout)
-    _get_checkbox_and_toggle("chkRIH_MinSW", checked)
+def _apply_checkbox_states(states: Mapping[str, bool]) -> None:
+    """Set several checkboxes on the current tab from a single FindAll pass."""
+    found = find_elements_by_ids(_get_app_root(), list(states), _TOGGLE_CACHE_REQUEST)
+    for automation_id, checked in states.items():
+        element = found.get(automation_id)
+        if element is None:
+            # Not resolved in the bulk pass; fall back to the per-id search
+            _get_checkbox_and_toggle(automation_id, checked)
+            continue
+        try:
+            is_checked = element.GetCachedPropertyValue(_UIA_TOGGLE_STATE_PROPERTY_ID) == 1  # 1 = On
+        except COMError:
+            # State not cached/available; let the live check decide
+            _toggle_checkbox(_wrap(element), checked)
+            continue
+        if is_checked != checked:
+            _wrap(element).toggle()
+
+
+# Checkbox states per run mode, grouped by the tab that hosts them. Each
+# group is applied with one tab selection and one bulk search.
+_CHECKBOX_PROFILES: dict[str, tuple[tuple[str, dict[str, bool]], ...]] = {
+    "POOH": (
+        ("Parameters", {
+            "chkFOE_POOH": True,
+            "chkFOE": False,
+            "chkDepth": True,
+            "chkFriction": False,
+            "chkPipeFluidDens": True,
+        }),
+        ("Outputs", {
+            "chkPOOH_MaxSW": True,
+            "chkPOOH_MaxYield": True,
+            "chkRIH_MinSW": False,
+        }),
+    ),
+    "RIH": (
+        ("Parameters", {
+            "chkFOE_POOH": False,
+            "chkFOE": True,
+            "chkDepth": True,
+            "chkFriction": False,
+            "chkPipeFluidDens": True,
+        }),
+        ("Outputs", {
+            "chkPOOH_MaxSW": False,
+            "chkPOOH_MaxYield": False,
+            "chkRIH_MinSW": True,
+        }),
+    ),
+}
+
+
+def _apply_checkbox_profile(mode: str, timeout: float = 90.0) -> None:
+    """Apply every checkbox group of a run-mode profile, tab by tab."""
+    ensure_tab = {"Parameters": _ensure_parameters_tab, "Outputs": _ensure_outputs_tab}
+    for tab, states in _CHECKBOX_PROFILES[mode]:
+        # The tab helpers skip select() when the tab already reports IsSelected
+        ensure_tab[tab](timeout=timeout)
+        _apply_checkbox_states(states)
 
 
 def Setup_POOH(timeout: float = 90.0) -> None:
     """Apply the checkbox combination required for POOH runs."""
-    _ensure_parameters_tab(timeout=timeout)
-    Parameters_POOH(checked=True, timeout=timeout)
-    Parameters_RIH(checked=False, timeout=timeout)
-    Parameters_Depth(checked=True, timeout=timeout)
-    Parameters_FF(checked=False, timeout=timeout)
-    Parameters_Pipe_fluid_density(checked=True, timeout=timeout)
-    _ensure_outputs_tab(timeout=timeout)
-    Parameters_Maximum_Surface_Weight_During_POOH(checked=True, timeout=timeout)
-    Parameters_Maximum_pipe_stress_during_POOH_percent_of_YS(checked=True, timeout=timeout)
-    Parameters_Minimum_Surface_Weight_During_RIH(checked=False, timeout=timeout)
+    _apply_checkbox_profile("POOH", timeout=timeout)
 
 
 def Set_Parameters_RIH(timeout: float = 90.0) -> None:
     """Apply the checkbox combination required for RIH runs."""
-    _ensure_parameters_tab(timeout=timeout)
-    Parameters_POOH(checked=False, timeout=timeout)
-    Parameters_RIH(checked=True, timeout=timeout)
-    Parameters_Depth(checked=True, timeout=timeout)
-    Parameters_FF(checked=False, timeout=timeout)
-    Parameters_Pipe_fluid_density(checked=True, timeout=timeout)
-    _ensure_outputs_tab(timeout=timeout)
-    Parameters_Maximum_Surface_Weight_During_POOH(checked=False, timeout=timeout)
-    Parameters_Maximum_pipe_stress_during_POOH_percent_of_YS(checked=False, timeout=timeout)
-    Parameters_Minimum_Surface_Weight_During_RIH(checked=True, timeout=timeout)
+    _apply_checkbox_profile("RIH", timeout=timeout)
 
 
 
@@ -350,72 +663,89 @@ def Set_Parameters_RIH(timeout: float = 90.0) -> None:
 # Parameter Matrix interaction
 # ---------------------------------------------------------------------------
 
+def _matrix_headers(table) -> list[str]:
+    """Read the Parameter Matrix header row (row 0) once, whitespace-normalized."""
+    if not _MATRIX_HEADERS:
+        grid = table.iface_grid
+        for col_idx in range(grid.CurrentColumnCount):
+            try:
+                # Name is what window_text() returns; no wrapper is needed to read it
+                header_text = _normalize_uia_name(grid.GetItem(0, col_idx).CurrentName)
+            except Exception:
+                header_text = ""
+            _MATRIX_HEADERS.append(header_text)
+    return _MATRIX_HEADERS
+
+
 def _find_matrix_column_by_name(table, column_name: str) -> int:
     """Find column index in Parameter Matrix by header name."""
-    # Get header row (row 0)
-    num_cols = table.iface_grid.CurrentColumnCount
-    
-    for col_idx in range(num_cols):
-        try:
-            header_cell = UIAWrapper(UIAElementInfo(table.iface_grid.GetItem(0, col_idx)))
-            header_text = header_cell.window_text().strip()
-            
-            # Check for exact match or partial match (case insensitive)
-            if column_name.lower() in header_text.lower():
-                return col_idx
-        except Exception:
-            continue
-    
+    cached = _MATRIX_COLUMN_CACHE.get(column_name)
+    if cached is not None:
+        return cached
+
+    # Check for exact match or partial match (case insensitive)
+    target = _normalize_uia_name(column_name)
+    for col_idx, header_text in enumerate(_matrix_headers(table)):
+        if target in header_text:
+            _MATRIX_COLUMN_CACHE[column_name] = col_idx
+            return col_idx
+
+    # Force a fresh header read next time in case the snapshot was incomplete
+    _MATRIX_HEADERS.clear()
     raise RuntimeError(f"Column '{column_name}' not found in Parameter Matrix")
 
 
 def Parameter_Matrix_Wizard(timeout: float = 90.0):
     """Open the Parameter Matrix wizard (button10)."""
-    root = _get_app_root()
-    main_uia = find_element_fast(root, "frmOrphSensitivity")
-    find_element_fast(main_uia.element_info.element, "cmdMatrix").click_input()
+    find_element_near(_get_sensitivity_root(), "cmdMatrix").click_input()
+
+
+def _get_matrix_grid():
+    """Get the cached Parameter Matrix grid wrapper, re-finding it once it closes."""
+    connection = _AppConnection()
+    grid = connection.matrix_grid
+    if grid is None or not _element_alive(grid.element_info.element):
+        matrix_root = _get_matrix_root()
+        element = find_element_near_raw(matrix_root, "grdVal") if matrix_root is not None else None
+        if element is None:
+            raise RuntimeError("Parameter Matrix grid 'grdVal' not found")
+        grid = connection.matrix_grid = _wrap(element)
+    return grid
+
+
+def _click_matrix_row0(column_name: str) -> None:
+    """Click the row-0 cell of ``column_name``, retrying once with a fresh grid."""
+    for attempt in range(2):
+        grid = _get_matrix_grid()
+        try:
+            col_idx = _find_matrix_column_by_name(grid, column_name)
+            _wrap(grid.iface_grid.GetItem(0, col_idx)).click_input()
+            return
+        except COMError:
+            # The grid went stale between the liveness check and the click
+            _AppConnection().matrix_grid = None
+            if attempt:
+                raise
 
 
 def Parameter_Matrix_BHA_Depth_Row0(timeout: float = 60.0):
     """Select and activate BHA Depth cell in Parameter Matrix."""
-    root = _get_app_root()
-    matrix_window = find_element_fast(root, "frmSensitivityMatrix")
-    table = find_element_fast(matrix_window.element_info.element, "grdVal")
-    col_idx = _find_matrix_column_by_name(table, "BHA Depth")
-    cell = UIAWrapper(UIAElementInfo(table.iface_grid.GetItem(0, col_idx)))
-    cell.click_input()
+    _click_matrix_row0("BHA Depth")
 
 
 def Parameter_Matrix_PFD_Row0(timeout: float = 60.0):
     """Select and activate Pipe Fluid Density cell in Parameter Matrix."""
-    root = _get_app_root()
-    matrix_window = find_element_fast(root, "frmSensitivityMatrix")
-    table = find_element_fast(matrix_window.element_info.element, "grdVal")
-    col_idx = _find_matrix_column_by_name(table, "Pipe Fluid Density")
-    cell = UIAWrapper(UIAElementInfo(table.iface_grid.GetItem(0, col_idx)))
-    #cell.set_focus()
-    cell.click_input()
+    _click_matrix_row0("Pipe Fluid Density")
 
 
 def Parameter_Matrix_FOE_POOH_Row0(timeout: float = 60.0):
     """Select and activate FOE POOH cell in Parameter Matrix."""
-    root = _get_app_root()
-    matrix_window = find_element_fast(root, "frmSensitivityMatrix")
-    table = find_element_fast(matrix_window.element_info.element, "grdVal")
-    col_idx = _find_matrix_column_by_name(table, "Force on End - POOH")
-    #table.set_focus()
-    cell = UIAWrapper(UIAElementInfo(table.iface_grid.GetItem(0, col_idx)))
-    cell.click_input()
+    _click_matrix_row0("Force on End - POOH")
 
 
 def Parameter_Matrix_FOE_RIH_Row0(timeout: float = 60.0):
     """Select and activate FOE RIH cell in Parameter Matrix."""
-    root = _get_app_root()
-    matrix_window = find_element_fast(root, "frmSensitivityMatrix")
-    table = find_element_fast(matrix_window.element_info.element, "grdVal")
-    col_idx = _find_matrix_column_by_name(table, "Force on End")
-    cell = UIAWrapper(UIAElementInfo(table.iface_grid.GetItem(0, col_idx)))
-    cell.click_input()
+    _click_matrix_row0("Force on End")
 
 
 # ---------------------------------------------------------------------------
@@ -432,46 +762,76 @@ def find_child_by_class(parent: int, class_name: str, automation_id: str, app_ui
     raise RuntimeError(f"Unable to locate control '{automation_id}'.")
 
 
-def Clear_Value_List() -> None:
-    """Remove all values from the Parameter Matrix value list."""
-    app_uia = _get_app()
-    root = _get_app_root()
+def _value_list_controls(*automation_ids: str) -> list:
+    """Resolve value-list controls as raw UIA elements in one pass."""
+    found = find_elements_by_ids(_get_app_root(), automation_ids)
+    return [found.get(automation_id) for automation_id in automation_ids]
+
+
+def _clear_values(list_element, delete_button) -> None:
+    """Delete every list item, in one press when the list allows multi-select."""
+    item_condition = _property_condition(_UIA_CONTROL_TYPE_PROPERTY_ID, _UIA_LIST_ITEM_CONTROL_TYPE_ID)
+    items = list_element.FindAll(TreeScope_Children, item_condition)
+    item_count = items.Length
+    if not item_count:
+        return
+    delete = _wrap(delete_button).iface_invoke
+
+    if item_count > 1 and list_element.GetCurrentPropertyValue(_UIA_SELECTION_CAN_SELECT_MULTIPLE_PROPERTY_ID):
+        _wrap(items.GetElement(0)).select()
+        for i in range(1, item_count):
+            _wrap(items.GetElement(i)).iface_selection_item.AddToSelection()
+        delete.Invoke()
+        # Whatever the button left behind goes through the one-by-one loop
+        item_count = list_element.FindAll(TreeScope_Children, item_condition).Length
+
+    # Select and delete the first list item until the list is empty
+    for _ in range(item_count):
+        item = list_element.FindFirst(TreeScope_Children, item_condition)
+        if not item:
+            break
+        _wrap(item).select()
+        delete.Invoke()
+
+
+def _add_values(txt_val, cmd_add, values: Sequence[str]) -> None:
+    """Type each value through ValuePattern and press Add through InvokePattern."""
+    set_value = _wrap(txt_val).iface_value.SetValue
+    add = _wrap(cmd_add).iface_invoke
+    for value in values:
+        set_value(value)
+        add.Invoke()
+
+
+def _normalize_value_strings(values: Sequence[str], caller: str) -> list[str]:
+    """Stringify a value list, rejecting an empty one for the named caller."""
+    normalized_values = list(map(str, values))
+    if not normalized_values:
+        raise ValueError(f"{caller} requires at least one value.")
+    return normalized_values
 
-    # Use fast lookup for list and delete button
-    value_list_uia = find_element_fast(root, "lstValues")
-    delete_button_uia = find_element_fast(root, "cmdDelete")
-    
-    # Convert to Win32 for item_texts() method
-    app_win32 = Application(backend="win32").connect(process=app_uia.process)
-    value_list = app_win32.window(handle=value_list_uia.handle).wrapper_object()
-    delete_button = app_win32.window(handle=delete_button_uia.handle).wrapper_object()
 
-    for _ in range(len(value_list.item_texts())):
-        value_list.click()
-        delete_button.click()
+def Clear_Value_List() -> None:
+    """Remove all values from the Parameter Matrix value list."""
+    value_list, delete_button = _value_list_controls("lstValues", "cmdDelete")
+    _clear_values(value_list, delete_button)
 
 
 def Populate_Value_List(values: Sequence[str]) -> None:
     """Populate the Parameter Matrix value list with the provided values."""
-    normalized_values = [str(item) for item in values]
-    if not normalized_values:
-        raise ValueError("Populate_Value_List requires at least one value.")
+    normalized_values = _normalize_value_strings(values, "Populate_Value_List")
+    txt_val, cmd_add = _value_list_controls("txtVal", "cmdAdd")
+    _add_values(txt_val, cmd_add, normalized_values)
 
-    app_uia = _get_app()
-    root = _get_app_root()
 
-    # Use fast lookup for text box and add button
-    txt_val_uia = find_element_fast(root, "txtVal")
-    cmd_add_uia = find_element_fast(root, "cmdAdd")
-    
-    # Convert to Win32 for set_text() method
-    app_win32 = Application(backend="win32").connect(process=app_uia.process)
-    txt_val = app_win32.window(handle=txt_val_uia.handle).wrapper_object()
-    cmd_add = app_win32.window(handle=cmd_add_uia.handle).wrapper_object()
-
-    for value in normalized_values:
-        txt_val.set_text(value)
-        cmd_add.click()
+def Replace_Value_List(values: Sequence[str]) -> None:
+    """Clear and repopulate the value list, resolving its controls only once."""
+    normalized_values = _normalize_value_strings(values, "Replace_Value_List")
+    value_list, delete_button, txt_val, cmd_add = _value_list_controls(
+        "lstValues", "cmdDelete", "txtVal", "cmdAdd"
+    )
+    _clear_values(value_list, delete_button)
+    _add_values(txt_val, cmd_add, normalized_values)
 
 
 def Edit_cmdOK(timeout: float = 60.0):
@@ -494,42 +854,20 @@ def Sensitivity_Analysis_Calculate(timeout: float = 60.0):
 
 def Sensitivity_Table(timeout: float = 90.0) -> pd.DataFrame:
     """Extract Sensitivity grid data and return as pandas DataFrame."""
-    # Get the app and refresh root to ensure we have current window
-    app = _get_app()
-    root = app.top_window().element_info.element
-    
-    # Find the sensitivity window and grid element
-    sensitivity_window = find_element_fast(root, "frmOrphSensitivity")
-    if not sensitivity_window:
+    # The window anchor is cached and revalidated on access
+    sensitivity_element = _get_sensitivity_root()
+    if sensitivity_element is None:
         raise RuntimeError("Sensitivity Analysis window not found")
     
-    sensitivity_element = sensitivity_window.element_info.element
-    grid = find_element_fast(sensitivity_element, "grdSensitivityData")
+    grid = find_element_near_raw(sensitivity_element, "grdSensitivityData")
     if not grid:
         raise RuntimeError("Sensitivity results grid 'grdSensitivityData' not found")
     
-    # Access grid's children (rows)
-    rows = grid.children()
+    # Rows and cell values arrive in one cached fetch
     data = []
     headers = []
     
-    for i, row in enumerate(rows):
-        row_data = []
-        cells = row.children()  # Get cells in the row
-        for cell in cells:
-            # Try to get actual value instead of title
-            try:
-                # Try Value pattern first
-                if hasattr(cell, 'iface_value') and cell.iface_value:
-                    cell_text = cell.get_value()
-                else:
-                    # Fall back to legacy value
-                    cell_text = cell.legacy_properties().get('Value', cell.window_text())
-            except:
-                # Last resort - use window text
-                cell_text = cell.window_text()
-            row_data.append(cell_text)
-        
+    for i, row_data in enumerate(_read_grid_rows(grid)):
         # Check if row is completely empty (all cells blank)
         is_empty_row = all(str(cell).strip() == "" for cell in row_data)
         
@@ -538,13 +876,9 @@ def Sensitivity_Table(timeout: float = 90.0) -> pd.DataFrame:
             continue
         
         # Check if this row looks like a header (first row or contains header-like content)
-        is_header = (i == 0) or any(
-            'BHA Depth' in str(cell) or 
-            'Pipe Fluid Density' in str(cell) or 
-            'Force on End' in str(cell) or
-            '\r(' in str(cell) 
-            for cell in row_data
-        )
+        is_header = (i == 0) or _HEADER_MARKER_RE.search(
+            _CELL_SEPARATOR.join(map(str, row_data))
+        ) is not None
         
         if is_header:
             headers = row_data  # This is a header row
@@ -559,15 +893,34 @@ def Sensitivity_Table(timeout: float = 90.0) -> pd.DataFrame:
         headers = data[0]
         data = data[1:]
     
-    # Create DataFrame
-    df = pd.DataFrame(data, columns=headers if headers else None)
-    
-    # Drop first column if it's just row numbers (typically "#")
-    if df.columns.tolist() and (df.columns[0] == "#" or df.columns[0] == ""):
-        df = df.iloc[:, 1:]
-    
-    # Remove empty columns
-    df = df.loc[:, df.apply(lambda col: col.astype(str).str.strip().ne("").any())]
+    # Short rows are padded with blanks rather than truncating every column
+    columns = list(zip_longest(*data, fillvalue="")) if data else [()] * len(headers)
+
+    # A header row that does not line up with the data cannot be trusted to
+    # label it; fail loudly rather than dropping or renaming result columns.
+    if len(columns) != len(headers):
+        raise RuntimeError(
+            f"Sensitivity grid has {len(headers)} headers but {len(columns)} data columns"
+        )
+
+    # Drop first column if it's just row numbers (typically "#") before it is
+    # ever materialized in the frame
+    if headers and (headers[0] == "#" or headers[0] == ""):
+        headers = headers[1:]
+        columns = columns[1:]
+
+    # Remove empty columns while they are still plain tuples, so the frame
+    # is only ever built from the columns that survive.
+    keep = _non_empty_columns(columns)
+    if not all(keep):
+        headers = [header for header, kept in zip(headers, keep) if kept]
+        columns = [column for column, kept in zip(columns, keep) if kept]
+
+    # Create DataFrame column-wise; positional keys keep duplicate headers intact.
+    # Grid cells are always text, so fix the schema up front and leave numeric
+    # typing to a single pass in _coerce_numeric_columns.
+    df = pd.DataFrame({idx: values for idx, values in enumerate(columns)}, dtype=object)
+    df.columns = headers
     
     # Convert numeric columns
     df = _coerce_numeric_columns(df)
@@ -599,7 +952,7 @@ def Exit(timeout: float = 60.0):
     
     # Force a fresh reconnection to get the new dialog window
     connection = _AppConnection()
-    connection.app = Application(backend="uia").connect(auto_id="frmOrpheus")
+    connection.app = _connect_app()
     connection.root = connection.app.top_window().element_info.element
     
     # Now search for btnNo in the new dialog
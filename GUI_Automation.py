@@ -1,8 +1,10 @@
 ﻿from __future__ import annotations
 
 import csv
+import functools
 import io
 import queue
+import re
 import threading
 import time
 import tkinter as tk
@@ -26,12 +28,37 @@ INPUT_COLUMNS = (
     ("stretch_foe_pooh", "POOH-WOB"),
 )
 
+_INPUT_KEYS = tuple(col for col, _ in INPUT_COLUMNS)
+
+
+@functools.cache
+def _log_path() -> Path:
+    """Resolve the error log path and create its folder on first use only."""
+    path = Path(__file__).resolve().parents[2] / "logs" / "automation_errors.log"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 MODE_RIH = "RIH"
 MODE_POOH = "POOH"
 
+# Virtual event the worker raises after queueing; the slow poll is only a safety net.
+_QUEUE_EVENT = "<<CerberusEvent>>"
+_QUEUE_POLL_MS = 1000
+
+# Result rows are rendered into the Treeview in pages as the user scrolls.
+_RESULT_PAGE_SIZE = 200
+
+# Everything that is not a letter or digit; stripped from pasted headers.
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
 
+
+@functools.lru_cache(maxsize=256)
 def _normalize_header(value: str) -> str:
-    return "".join(ch for ch in value.lower() if ch.isalnum())
+    return _NON_ALNUM_RE.sub("", value.lower())
+
+
+_NORMALIZED_TARGETS = tuple(_normalize_header(value) for _, value in INPUT_COLUMNS)
 
 
 class KeepAwake:
@@ -45,12 +72,16 @@ class KeepAwake:
     def __exit__(self, exc_type, exc, tb) -> None:
         self._set_state(self.ES_CONTINUOUS)
 
-    @staticmethod
-    def _set_state(flags: int) -> None:
+    _set_execution_state: Any = None
+
+    @classmethod
+    def _set_state(cls, flags: int) -> None:
         try:
-            import ctypes
+            if cls._set_execution_state is None:
+                import ctypes
 
-            ctypes.windll.kernel32.SetThreadExecutionState(flags)
+                cls._set_execution_state = ctypes.windll.kernel32.SetThreadExecutionState
+            cls._set_execution_state(flags)
         except Exception:
             pass
 
@@ -62,12 +93,10 @@ class CerberusApp(tk.Tk):
         self.title("Sensitivity Runner")
         self.geometry("1200x720")
 
-        self.log_path = Path(__file__).resolve().parents[2] / "logs" / "automation_errors.log"
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
-
         self.engine = CerberusEngine()
-        self.event_queue: queue.Queue = queue.Queue()
-        self.progress = ProgressReporter(self._enqueue_event)
+        self.event_queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Events are queued for the Tk thread, so each row needs its own payload.
+        self.progress = ProgressReporter(self._enqueue_event, retain_payloads=True)
         self.worker_thread: threading.Thread | None = None
         self.cancel_event = threading.Event()
         self.total_rows = 0
@@ -75,6 +104,7 @@ class CerberusApp(tk.Tk):
         self.timer_var = tk.StringVar(value="Elapsed: 00:00:00")
         self._timer_start: float | None = None
         self._timer_job: str | None = None
+        self._last_displayed_seconds = -1
         self._keep_awake: KeepAwake | None = None
         self._inputs_enabled = True
 
@@ -85,9 +115,14 @@ class CerberusApp(tk.Tk):
         self.pooh_df = pd.DataFrame()
         self._rih_columns: List[str] = []
         self._pooh_columns: List[str] = []
-        self._progress_rows: Dict[str, List[Dict[str, Any]]] = {MODE_RIH: [], MODE_POOH: []}
-        self._progress_columns: Dict[str, List[str]] = {MODE_RIH: [], MODE_POOH: []}
+        # Streamed progress rows are stored column-wise: column name -> values, in arrival order.
+        self._progress_data: Dict[str, Dict[str, List[Any]]] = {MODE_RIH: {}, MODE_POOH: {}}
         self._processed_counts: Dict[str, int] = {MODE_RIH: 0, MODE_POOH: 0}
+        self._flushed_counts: Dict[str, int] = {MODE_RIH: 0, MODE_POOH: 0}
+        self._tree_columns_configured: Dict[str, tuple] = {MODE_RIH: (), MODE_POOH: ()}
+        self._flush_scheduled = False
+        self._rendered_counts: Dict[str, int] = {MODE_RIH: 0, MODE_POOH: 0}
+        self._render_sources: Dict[str, pd.DataFrame | None] = {MODE_RIH: None, MODE_POOH: None}
 
         # Step 2: UI widget placeholders
         self.input_tree: ttk.Treeview
@@ -103,7 +138,8 @@ class CerberusApp(tk.Tk):
 
         self._build_layout()
         self._set_controls_enabled(True)
-        self.after(100, self._process_queue)
+        self.bind(_QUEUE_EVENT, lambda _event: self._drain_queue())
+        self.after(_QUEUE_POLL_MS, self._process_queue)
 
     def _build_layout(self) -> None:
         # Step 2: Build input capture panel
@@ -159,8 +195,8 @@ class CerberusApp(tk.Tk):
         notebook.add(rih_tab, text="RIH Results")
         notebook.add(pooh_tab, text="POOH Results")
 
-        self.rih_tree = self._create_result_tree(rih_tab)
-        self.pooh_tree = self._create_result_tree(pooh_tab)
+        self.rih_tree = self._create_result_tree(rih_tab, MODE_RIH)
+        self.pooh_tree = self._create_result_tree(pooh_tab, MODE_POOH)
 
         copy_row = ttk.Frame(result_frame)
         copy_row.pack(fill=tk.X)
@@ -169,9 +205,18 @@ class CerberusApp(tk.Tk):
         self.btn_copy_pooh = ttk.Button(copy_row, text="Copy POOH Results", command=lambda: self._copy_results(MODE_POOH))
         self.btn_copy_pooh.pack(side=tk.LEFT, padx=(5, 0))
 
-    def _create_result_tree(self, parent: ttk.Frame) -> ttk.Treeview:
+    def _create_result_tree(self, parent: ttk.Frame, mode: str) -> ttk.Treeview:
         tree = ttk.Treeview(parent, columns=(), show="headings", selectmode="browse")
-        tree.pack(fill=tk.BOTH, expand=True)
+        scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=tree.yview)
+
+        def _on_scroll(first: str, last: str) -> None:
+            scrollbar.set(first, last)
+            if float(last) > 0.95:
+                self._render_next_page(mode)
+
+        tree.configure(yscrollcommand=_on_scroll)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         return tree
 
     def _set_controls_enabled(self, enabled: bool) -> None:
@@ -192,9 +237,9 @@ class CerberusApp(tk.Tk):
         rows: List[Dict[str, Any]] = []
         for item in self.input_tree.get_children():
             values = self.input_tree.item(item, "values")
-            row = {col: values[idx] for idx, (col, _) in enumerate(INPUT_COLUMNS)}
-            if any(value not in ("", None) for value in row.values()):
-                rows.append(row)
+            # Tk may hand back ints, so 0 must still count as a value.
+            if any(value != "" and value is not None for value in values):
+                rows.append(dict(zip(_INPUT_KEYS, values)))
         return rows
 
     def _add_input_row(self) -> None:
@@ -257,45 +302,42 @@ class CerberusApp(tk.Tk):
         if not raw:
             return []
 
-        reader = csv.reader(io.StringIO(raw), delimiter="\t")
-        rows = [list(row) for row in reader]
-        if not rows:
-            return []
-
-        normalized_targets = [_normalize_header(value) for _, value in INPUT_COLUMNS]
-        normalized_sources = [_normalize_header(value) for value in rows[0]]
-
-        header_lookup: Dict[str, int] = {}
-        data_rows = rows
-        if rows and normalized_sources:
-            has_header = all(target in normalized_sources for target in normalized_targets)
-            if has_header:
-                header_lookup = {value: idx for idx, value in enumerate(normalized_sources)}
-                data_rows = rows[1:]
+        # Peek the first line to decide whether it is a header row.
+        stream = io.StringIO(raw)
+        first_cells = next(csv.reader([stream.readline()], delimiter="\t"), [])
+        normalized_sources = [_normalize_header(value) for value in first_cells]
+        has_header = bool(normalized_sources) and all(
+            target in normalized_sources for target in _NORMALIZED_TARGETS
+        )
+        if has_header:
+            fieldnames = normalized_sources
+        else:
+            fieldnames = list(_NORMALIZED_TARGETS)
+            stream.seek(0)
 
-        if not header_lookup:
-            header_lookup = {target: idx for idx, target in enumerate(normalized_targets)}
+        reader = csv.DictReader(stream, fieldnames=fieldnames, restval="", delimiter="\t")
+        field_keys = [(dest_key, target) for target, (dest_key, _) in zip(_NORMALIZED_TARGETS, INPUT_COLUMNS)]
 
         parsed: List[Dict[str, Any]] = []
-        for raw_row in data_rows:
-            row_map: Dict[str, Any] = {}
-            non_empty = False
-            for column_index, (target, (dest_key, _)) in enumerate(zip(normalized_targets, INPUT_COLUMNS)):
-                idx = header_lookup.get(target, column_index)
-                cell_value = raw_row[idx] if idx < len(raw_row) else ""
-                if isinstance(cell_value, str):
-                    cell_value = cell_value.strip()
-                row_map[dest_key] = cell_value
-                if cell_value not in ("", None):
-                    non_empty = True
-            if non_empty:
+        for raw_row in reader:
+            row_map = {dest_key: raw_row[target].strip() for dest_key, target in field_keys}
+            if any(row_map.values()):
                 parsed.append(row_map)
         return parsed
 
     def _enqueue_event(self, event: str, payload: Dict[str, Any]) -> None:
         self.event_queue.put((event, payload))
+        try:
+            self.event_generate(_QUEUE_EVENT, when="tail")
+        except (tk.TclError, RuntimeError):
+            # Main loop not running (or window gone); the fallback poll drains the queue.
+            pass
 
     def _process_queue(self) -> None:
+        self._drain_queue()
+        self.after(_QUEUE_POLL_MS, self._process_queue)
+
+    def _drain_queue(self) -> None:
         while True:
             try:
                 event, payload = self.event_queue.get_nowait()
@@ -310,8 +352,11 @@ class CerberusApp(tk.Tk):
                 self.status_var.set(status)
                 self._set_controls_enabled(False)
                 for mode in (MODE_RIH, MODE_POOH):
-                    self._progress_rows[mode].clear()
-                    self._progress_columns[mode].clear()
+                    self._progress_data[mode].clear()
+                    self._flushed_counts[mode] = 0
+                    self._tree_columns_configured[mode] = ()
+                    self._render_sources[mode] = None
+                    self._rendered_counts[mode] = 0
                     self._processed_counts[mode] = 0
                     tree = self.pooh_tree if mode == MODE_POOH else self.rih_tree
                     for item in tree.get_children():
@@ -323,31 +368,55 @@ class CerberusApp(tk.Tk):
                 self._handle_done(payload)
             elif event == "error":
                 self._handle_error(payload.get("message", "Unexpected error"))
-        self.after(100, self._process_queue)
 
     def _handle_row_event(self, payload: Dict[str, Any]) -> None:
         mode = (payload.get("mode") or MODE_RIH).upper()
-        row_data = dict(payload)
-        row_data.pop("mode", None)
-        self._processed_counts[mode] = self._processed_counts.get(mode, 0) + 1
+        count = self._processed_counts[mode]
+        progress_data = self._progress_data[mode]
 
-        progress_rows = self._progress_rows[mode]
-        progress_columns = self._progress_columns[mode]
-        tree = self.pooh_tree if mode == MODE_POOH else self.rih_tree
-
-        progress_rows.append(row_data)
-        if not progress_columns:
-            progress_columns.extend(row_data.keys())
-        else:
-            for key in row_data.keys():
-                if key not in progress_columns:
-                    progress_columns.append(key)
-        tree.configure(columns=progress_columns)
-        for col in progress_columns:
-            tree.heading(col, text=col)
-            tree.column(col, width=160, anchor=tk.CENTER)
-        values = [row_data.get(col, "") for col in progress_columns]
-        tree.insert("", tk.END, values=values)
+        filled = 0
+        for key, value in payload.items():
+            if key == "mode":
+                continue
+            column = progress_data.get(key)
+            if column is None:
+                column = progress_data[key] = [""] * count
+            column.append(value)
+            filled += 1
+        if filled < len(progress_data):
+            for column in progress_data.values():
+                if len(column) == count:
+                    column.append("")
+        self._processed_counts[mode] = count + 1
+
+        # Coalesce tree updates: rows arriving in one burst are inserted together
+        # on the next idle tick instead of one Tk round-trip set per row.
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_tree_inserts)
+
+    def _flush_tree_inserts(self) -> None:
+        self._flush_scheduled = False
+        flushed = False
+        for mode, progress_data in self._progress_data.items():
+            start = self._flushed_counts[mode]
+            stop = self._processed_counts[mode]
+            if start >= stop or not progress_data:
+                continue
+            tree = self.pooh_tree if mode == MODE_POOH else self.rih_tree
+            progress_columns = tuple(progress_data)
+            if progress_columns != self._tree_columns_configured[mode]:
+                tree.configure(columns=progress_columns)
+                for col in progress_columns:
+                    tree.heading(col, text=col)
+                    tree.column(col, width=160, anchor=tk.CENTER)
+                self._tree_columns_configured[mode] = progress_columns
+            for values in zip(*(column[start:stop] for column in progress_data.values())):
+                tree.insert("", tk.END, values=values)
+            self._flushed_counts[mode] = stop
+            flushed = True
+        if not flushed:
+            return
         processed = self._total_processed_rows()
         message = (
             f"Processed {processed}/{self.total_rows} rows"
@@ -357,6 +426,7 @@ class CerberusApp(tk.Tk):
         self.status_var.set(message)
 
     def _handle_done(self, payload: Dict[str, Any]) -> None:
+        self._flush_tree_inserts()
         self._stop_timer()
         outputs = payload.get("outputs")
         if isinstance(outputs, dict):
@@ -372,19 +442,15 @@ class CerberusApp(tk.Tk):
         updated_modes: List[str] = []
         for mode_key, rows in outputs.items():
             normalized = mode_key.upper()
+            frame: pd.DataFrame | None = None
+            incoming: List[Dict[str, Any]] = []
             if isinstance(rows, pd.DataFrame):
-                incoming = rows.to_dict(orient="records")
+                frame = rows.reset_index(drop=True)
             elif isinstance(rows, list):
                 if rows and all(isinstance(item, BatchResult) for item in rows):
-                    incoming: List[Dict[str, Any]] = []
-                    for batch in rows:
-                        table = batch.table if isinstance(batch.table, pd.DataFrame) else None
-                        if table is None:
-                            continue
-                        batch_records = table.to_dict(orient="records")
-                        incoming.extend(batch_records)
+                    tables = [batch.table for batch in rows if isinstance(batch.table, pd.DataFrame)]
+                    frame = pd.concat(tables, ignore_index=True) if tables else pd.DataFrame()
                 else:
-                    incoming = []
                     for item in rows:
                         if isinstance(item, dict):
                             incoming.append(dict(item))
@@ -396,25 +462,28 @@ class CerberusApp(tk.Tk):
                 continue
             target_rows, _, columns = self._resolve_mode_targets(normalized)
             target_rows.clear()
-            if incoming:
-                target_rows.extend(dict(row) for row in incoming)
-                columns.clear()
-                columns.extend(incoming[0].keys())
+            columns.clear()
+            if frame is not None:
+                # Tabular sources stay columnar; no per-row dicts are materialized.
+                columns.extend(frame.columns)
             else:
-                columns.clear()
-            self._progress_rows[normalized].clear()
-            self._progress_columns[normalized].clear()
+                # Every branch above already built fresh dicts, so no defensive copy here.
+                target_rows.extend(incoming)
+                columns.extend(dict.fromkeys(key for row in incoming for key in row))
+                # The column order is already known, so skip pandas' per-record schema inference.
+                frame = pd.DataFrame.from_records(target_rows, columns=columns)
+            if normalized == MODE_POOH:
+                self.pooh_df = frame
+            else:
+                self.rih_df = frame
+            self._progress_data[normalized].clear()
             updated_modes.append(normalized)
 
-        self.rih_df = pd.DataFrame(self.rih_rows)
-        self.pooh_df = pd.DataFrame(self.pooh_rows)
-        self._rih_columns = list(self.rih_df.columns)
-        self._pooh_columns = list(self.pooh_df.columns)
-
         for mode in updated_modes:
             self._reload_tree(mode)
 
     def _handle_error(self, message: str) -> None:
+        self._flush_tree_inserts()
         self.status_var.set("Error")
         self._stop_timer()
         self._set_controls_enabled(True)
@@ -428,7 +497,7 @@ class CerberusApp(tk.Tk):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         entry = f"[{timestamp}] {message.strip()}\n"
         try:
-            with self.log_path.open("a", encoding="utf-8") as log_file:
+            with _log_path().open("a", encoding="utf-8") as log_file:
                 log_file.write(entry)
                 log_file.write("\n")
         except Exception:
@@ -456,6 +525,7 @@ class CerberusApp(tk.Tk):
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 self._enqueue_event("error", {"message": str(exc)})
 
+        # Daemon thread so closing the window ends an in-flight run with it
         self.worker_thread = threading.Thread(target=worker, daemon=True)
         self.worker_thread.start()
 
@@ -476,12 +546,10 @@ class CerberusApp(tk.Tk):
         if df.empty:
             messagebox.showinfo("Copy Results", f"No {mode} results to copy yet.")
             return
-        drop_columns = [col for col in ("mode", "batch_index") if col in df.columns]
-        export_df = df.drop(columns=drop_columns, errors="ignore")
-        export_df = export_df.fillna("")
-        export_df = export_df.astype(str)
+        # Boolean mask, not labels: result tables may repeat a header name.
+        export = df.loc[:, ~df.columns.isin(("mode", "batch_index"))]
         buffer = io.StringIO()
-        export_df.to_csv(buffer, sep="\t", index=False, lineterminator="\n")
+        export.to_csv(buffer, sep="\t", index=False, lineterminator="\n", na_rep="")
         self.clipboard_clear()
         self.clipboard_append(buffer.getvalue())
         messagebox.showinfo("Copy Results", f"{mode} results copied to clipboard.")
@@ -504,8 +572,11 @@ class CerberusApp(tk.Tk):
         self._rih_columns.clear()
         self._pooh_columns.clear()
         for mode in (MODE_RIH, MODE_POOH):
-            self._progress_rows[mode].clear()
-            self._progress_columns[mode].clear()
+            self._progress_data[mode].clear()
+            self._flushed_counts[mode] = 0
+            self._tree_columns_configured[mode] = ()
+            self._render_sources[mode] = None
+            self._rendered_counts[mode] = 0
             self._processed_counts[mode] = 0
         for tree in (self.rih_tree, self.pooh_tree):
             for item in tree.get_children():
@@ -513,20 +584,39 @@ class CerberusApp(tk.Tk):
             tree.configure(columns=())
 
     def _reload_tree(self, mode: str) -> None:
-        rows, tree, columns = self._resolve_mode_targets(mode)
+        _, tree, columns = self._resolve_mode_targets(mode)
+        key = MODE_POOH if mode.upper() == MODE_POOH else MODE_RIH
+        df = self.pooh_df if key == MODE_POOH else self.rih_df
         for item in tree.get_children():
             tree.delete(item)
-        if not rows:
+        self._rendered_counts[key] = 0
+        # Result columns replace whatever the progress stream configured.
+        self._tree_columns_configured[key] = ()
+        if df.empty:
+            self._render_sources[key] = None
             tree.configure(columns=())
             return
         if not columns:
-            columns.extend(rows[0].keys())
+            columns.extend(df.columns)
         tree.configure(columns=columns)
         for col in columns:
             tree.heading(col, text=col)
             tree.column(col, width=160, anchor=tk.CENTER)
-        for row in rows:
-            values = [row.get(col, "") for col in columns]
+        self._render_sources[key] = df
+        self._render_next_page(key)
+
+    def _render_next_page(self, mode: str) -> None:
+        df = self._render_sources.get(mode)
+        if df is None:
+            return
+        start = self._rendered_counts[mode]
+        if start >= len(df):
+            return
+        tree = self.pooh_tree if mode == MODE_POOH else self.rih_tree
+        page = df.iloc[start : start + _RESULT_PAGE_SIZE]
+        self._rendered_counts[mode] = start + len(page)
+        display = page.astype(object).where(page.notna(), "")
+        for values in display.itertuples(index=False, name=None):
             tree.insert("", tk.END, values=values)
 
     @staticmethod
@@ -541,14 +631,18 @@ class CerberusApp(tk.Tk):
             self.after_cancel(self._timer_job)
             self._timer_job = None
         self._timer_start = time.perf_counter()
+        self._last_displayed_seconds = 0
         self.timer_var.set("Elapsed: 00:00:00")
         self._schedule_timer_tick()
 
     def _schedule_timer_tick(self) -> None:
         if self._timer_start is None:
             return
-        elapsed = time.perf_counter() - self._timer_start
-        self.timer_var.set(f"Elapsed: {self._format_elapsed(elapsed)}")
+        elapsed = int(time.perf_counter() - self._timer_start)
+        # Only touch the StringVar when the displayed second actually changes.
+        if elapsed != self._last_displayed_seconds:
+            self._last_displayed_seconds = elapsed
+            self.timer_var.set(f"Elapsed: {self._format_elapsed(elapsed)}")
         self._timer_job = self.after(1000, self._schedule_timer_tick)
 
     def _stop_timer(self) -> None:
@@ -3,15 +3,15 @@ import shutil
 from pathlib import Path
 import comtypes.client
 
+# comtypes gen directory, resolved once at import
+_GEN_DIR = Path(comtypes.client.__file__).resolve(strict=False).parent / "gen"
+
 def clear_cache():
     """Remove all comtypes generated files and regenerate UIAutomation."""
-    # Find comtypes gen directory
-    gen_dir = Path(comtypes.client.__file__).parent / "gen"
-    
-    if gen_dir.exists():
-        print(f"Clearing comtypes cache at: {gen_dir}")
+    if _GEN_DIR.exists():
+        print(f"Clearing comtypes cache at: {_GEN_DIR}")
         # Remove all files except __pycache__ and __init__.py
-        for item in gen_dir.iterdir():
+        for item in _GEN_DIR.iterdir():
             if item.name not in ("__pycache__", "__init__.py"):
                 if item.is_file():
                     item.unlink()